@@ -13,8 +13,277 @@
 # wins when the opposing player has no 'rings' or 'circles' of 8 stones all owned by the player, with an empty center.
 # Detailed rules can be found at {{https://www.chessvariants.com/crossover.dir/gess.html}}.
 
+import functools
+import sys
+
+import numpy as np
 from termcolor import colored
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional. Without it, the helpers decorated with njit below run as plain Python functions.
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+# Integer codes stored in the board array for the contents of each square.
+_EMPTY = 0
+_BLACK = 1
+_WHITE = 2
+
+# Maps player names to the code of the stones they own.
+_PLAYER_CODES = {"BLACK": _BLACK, "WHITE": _WHITE}
+
+# Integer codes for the state of the game, and the names get_game_state returns for them, indexed by code. A player's
+# win has the same code as the stones they own.
+_UNFINISHED = 0
+_BLACK_WON = _BLACK
+_WHITE_WON = _WHITE
+_STATE_NAMES = ("UNFINISHED", "BLACK_WON", "WHITE_WON")
+_STATE_CODES = {name: state for state, name in enumerate(_STATE_NAMES)}
+
+# Reasons a move can be rejected, returned by the move checks. _VALID means that the check passed.
+_VALID = 0
+_BAD_INPUT = 1
+_EDGE_FOOTPRINT = 2
+_OPPONENT_STONES = 3
+_NO_STONES = 4
+_TOO_MANY_SPACES = 5
+_DIRECTION_MISMATCH = 6
+_INVALID_MOVEMENT = 7
+_OBSTRUCTED = 8
+
+# Message printed for each reason a move can be rejected.
+_ERROR_MESSAGES = {
+    _BAD_INPUT: "Bad input! Enter valid coordinates for pieces!",
+    _EDGE_FOOTPRINT: "Footprints can't be centered on the edge of the board!",
+    _OPPONENT_STONES: "Contains opponents stones, you can't move this footprint!",
+    _NO_STONES: "None of your stones are present in this footprint. You can't move this footprint!",
+    _TOO_MANY_SPACES: "You are trying to move too many spaces!",
+    _DIRECTION_MISMATCH: "Mismatch of directions! Can't move that way!",
+    _INVALID_MOVEMENT: "Invalid movement!",
+    _OBSTRUCTED: "Obstructed path!",
+}
+
+# Starting layout of the board, one row per bytes string, with "B" for black stones, "W" for white stones and "E" for
+# empty squares.
+_START_ROWS = (
+   #  abcdefghijklmnopqrst
+    b"EEEEEEEEEEEEEEEEEEEE",  # 20
+    b"EEWEWEWWWWWWWWEWEWEE",  # 19
+    b"EWWWEWEWWWWEWEWEWWWE",  # 18
+    b"EEWEWEWWWWWWWWEWEWEE",  # 17
+    b"EEEEEEEEEEEEEEEEEEEE",  # 16
+    b"EEEEEEEEEEEEEEEEEEEE",  # 15
+    b"EEWEEWEEWEEWEEWEEWEE",  # 14
+    b"EEEEEEEEEEEEEEEEEEEE",  # 13
+    b"EEEEEEEEEEEEEEEEEEEE",  # 12
+    b"EEEEEEEEEEEEEEEEEEEE",  # 11
+    b"EEEEEEEEEEEEEEEEEEEE",  # 10
+    b"EEEEEEEEEEEEEEEEEEEE",  # 9
+    b"EEEEEEEEEEEEEEEEEEEE",  # 8
+    b"EEBEEBEEBEEBEEBEEBEE",  # 7
+    b"EEEEEEEEEEEEEEEEEEEE",  # 6
+    b"EEEEEEEEEEEEEEEEEEEE",  # 5
+    b"EEBEBEBBBBBBBBEBEBEE",  # 4
+    b"EBBBEBEBBBBEBEBEBBBE",  # 3
+    b"EEBEBEBBBBBBBBEBEBEE",  # 2
+    b"EEEEEEEEEEEEEEEEEEEE",  # 1
+)
+
+# Square code of each byte value used in _START_ROWS, indexed by byte value.
+_CODE_FROM_BYTE = np.zeros(256, dtype=np.uint8)
+_CODE_FROM_BYTE[ord("B")] = _BLACK
+_CODE_FROM_BYTE[ord("W")] = _WHITE
+
+# Starting board as a 20x20 array of square codes, decoded from the bytes of _START_ROWS in one lookup.
+_START_BOARD = _CODE_FROM_BYTE[np.frombuffer(b"".join(_START_ROWS), dtype=np.uint8).reshape(20, 20)]
+
+# Letters labelling the board columns, indexed by column number, and the reverse lookup.
+_COL_LETTERS = "abcdefghijklmnopqrst"
+_COL_TO_IDX = {letter: index for index, letter in enumerate(_COL_LETTERS)}
+
+# (row, column) offsets from the center of a footprint to each of its 9 squares, in the order center, NW, W, SW, S, N,
+# NE, E, SE. The order is relied upon wherever a footprint index is used to refer to a square.
+_OFFSETS = np.array([[0, 0], [-1, -1], [0, -1], [1, -1], [1, 0], [-1, 0], [-1, 1], [0, 1], [1, 1]], dtype=np.int8)
+
+# Direction ids, (sign of row change + 1) * 3 + (sign of column change + 1). A direction's id is also the index of the
+# square it points towards in the row-major flattened 3x3 section of the board covered by a footprint.
+_NORTHWEST, _NORTH, _NORTHEAST, _WEST, _NO_DIRECTION, _EAST, _SOUTHWEST, _SOUTH, _SOUTHEAST = range(9)
+
+# Change in row and column of a single step in each direction, and an array of the (row, column) offsets from the
+# center of the squares a footprint moves into when it takes that step, which must be empty for it to pass. The offsets
+# are resolved from the footprint indices of those squares.
+_DIRECTION_TABLE = {
+    direction: (step_row, step_column, _OFFSETS[footprint_indices])
+    for direction, step_row, step_column, footprint_indices in (
+        (_NORTHWEST, -1, -1, [1, 2, 3, 5, 6]),  # NW(1), W(2), SW(3), N(5), NE(6).
+        (_NORTH, -1, 0, [1, 5, 6]),  # NW(1), N(5), NE(6).
+        (_NORTHEAST, -1, 1, [1, 5, 6, 7, 8]),  # NW(1), N(5), NE(6), E(7), SE(8).
+        (_WEST, 0, -1, [1, 2, 3]),  # NW(1), W(2), SW(3).
+        (_EAST, 0, 1, [6, 7, 8]),  # NE(6), E(7), SE(8).
+        (_SOUTHWEST, 1, -1, [1, 2, 3, 4, 8]),  # NW(1), W(2), SW(3), S(4), SE(8).
+        (_SOUTH, 1, 0, [3, 4, 8]),  # SW(3), S(4), SE(8).
+        (_SOUTHEAST, 1, 1, [3, 4, 6, 7, 8]),  # SW(3), S(4), NE(6), E(7), SE(8).
+    )
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _to_grid_coordinate(coordinates):
+    """Takes in string coordinates in 'b6' format and returns the (row, column) indices of that square on the board.
+    There are only 400 squares on the board, so the results are cached rather than parsed again on every move. Raises
+    KeyError if the column letter isn't one on the board.
+    """
+
+    # Grabs first letter of coordinate and gets the column number from the module level lookup.
+    column = _COL_TO_IDX[coordinates[0]]
+    # Row coordinate looks at the rest of the characters of the entered location to locate the row.
+    row = 20 - int(coordinates[1:])
+
+    return row, column
+
+
+# The explicit signature has Numba compile _check_path when the module is imported (or load it from the on-disk cache),
+# rather than pausing the first move of a game to compile it.
+@njit("boolean(uint8[:, :], int64, int64, int64, int64, int64, int64, int8[:, :], uint8)", cache=True, nogil=True)
+def _check_path(board, start_row, start_column, dest_row, dest_column, step_row, step_column, key_offsets,
+                empty_code):
+    """Walks the center of a footprint from (start_row, start_column), the first step of a move, towards
+    (dest_row, dest_column), moving (step_row, step_column) each step. At each step before the destination, checks
+    the squares at key_offsets, the (row, column) offsets from the center of the squares a footprint moves into when
+    taking that step. Returns True if all of them are empty, False if the path is obstructed. Kept free of Python
+    objects so that it can be compiled by Numba, which doesn't bounds check indexing, so the destination must be in a
+    straight line from the start and at least one square from the edge of the board.
+    """
+
+    row = start_row
+    column = start_column
+    while row != dest_row or column != dest_column:
+        for k in range(key_offsets.shape[0]):
+            if board[row + key_offsets[k, 0], column + key_offsets[k, 1]] != empty_code:
+                return False
+        row += step_row
+        column += step_column
+    return True
+
+
+@njit("Tuple((boolean, boolean, int64, boolean))(uint8[:, :], uint8, uint8)", cache=True, nogil=True)
+def _scan_piece(piece, current_code, waiting_code):
+    """Takes in the 3x3 section of the board covered by a piece and the codes of the stones of the player who is
+    attempting to move it and of their opponent. In a single pass over the 9 squares, determines if the piece contains
+    any of the opponent's stones, if it contains any of the player's stones, the bitmask of direction ids the piece is
+    allowed to move in according to which of its outer squares hold the player's stones, and if its center holds one
+    of the player's stones. Returns those four values as a tuple.
+    """
+
+    has_opponent = False
+    has_own = False
+    allowed_directions = 0
+    center_has_own = False
+    for row in range(3):
+        for column in range(3):
+            space = piece[row, column]
+            if space == waiting_code:
+                has_opponent = True
+            elif space == current_code:
+                has_own = True
+                # The direction a square points towards has the same id as the square's index.
+                index = row * 3 + column
+                if index == _NO_DIRECTION:
+                    center_has_own = True
+                else:
+                    allowed_directions |= 1 << index
+    return has_opponent, has_own, allowed_directions, center_has_own
+
+
+@njit("boolean(uint8[:, :], uint8)", cache=True, nogil=True)
+def _find_ring(board, opponent_code):
+    """Takes in the board and the code of the stones of the player whose rings are being looked for. Returns True if
+    there is an empty space not on the edge of the board with one of that player's stones in each of the 8 squares
+    around it (a ring), False otherwise. Each space is compared square by square, moving on to the next space at the
+    first square that doesn't match, which is cheap once compiled by Numba.
+    """
+
+    for row in range(1, 19):
+        for column in range(1, 19):
+            if (board[row, column] == _EMPTY
+                    and board[row - 1, column - 1] == opponent_code and board[row, column - 1] == opponent_code
+                    and board[row + 1, column - 1] == opponent_code and board[row + 1, column] == opponent_code
+                    and board[row - 1, column] == opponent_code and board[row - 1, column + 1] == opponent_code
+                    and board[row, column + 1] == opponent_code and board[row + 1, column + 1] == opponent_code):
+                return True
+    return False
+
+
+def _obstruction_check(board, start_row, start_column, dest_row, dest_column, direction):
+    """Checks desired path of a piece from start-finish in the direction with the given id to see if it is impeded by
+    any stones. Will return _INVALID_MOVEMENT or _OBSTRUCTED if the path is invalid and _VALID if the path is valid.
+    """
+
+    # Catches if the player has entered movement that 'uses multiple directions' such as a move from n6 to o8, wherein
+    # the player is trying to move northeast then north. Together with the edge check in _validate, this keeps the
+    # walk below on the board without checking bounds at each step.
+    if start_row != dest_row and start_column != dest_column and \
+            abs(dest_row - start_row) != abs(dest_column - start_column):
+        return _INVALID_MOVEMENT
+
+    # Walks a temporary center from the first step in the desired direction to the destination.
+    step_row, step_column, key_offsets = _DIRECTION_TABLE[direction]
+    if not _check_path(board, start_row + step_row, start_column + step_column, dest_row, dest_column, step_row,
+                       step_column, key_offsets, _EMPTY):
+        return _OBSTRUCTED
+    return _VALID
+
+
+@functools.lru_cache(maxsize=2 ** 16)
+def _validate(board_bytes, start_row, start_column, dest_row, dest_column, current_code, waiting_code):
+    """Takes in the bytes of a board array, the (row, column) centers of the start and destination footprints of a
+    move and the codes of the stones of the player making the move and of their opponent. Checks that the piece is
+    valid and that the move is valid. Returns _VALID if so, otherwise the reason it isn't. Only depends on its
+    arguments, so results are cached for positions and moves that are checked again, e.g. when searching for moves.
+    """
+
+    # Footprints are 3x3, so their centers can't be on the outer rows and columns of the board.
+    for center_row, center_column in ((start_row, start_column), (dest_row, dest_column)):
+        if not (1 <= center_row <= 18 and 1 <= center_column <= 18):
+            return _EDGE_FOOTPRINT
+
+    # The board, and the 3x3 section of it covered by the piece. (A bytearray is used so that the array is writable,
+    # which is the type _check_path is compiled for.)
+    board = np.frombuffer(bytearray(board_bytes), dtype=np.uint8).reshape(20, 20)
+    piece = board[start_row - 1:start_row + 2, start_column - 1:start_column + 2]
+
+    # Determines desired direction id from the signs of the row and column changes between the centers.
+    row_sign = (dest_row > start_row) - (dest_row < start_row)
+    column_sign = (dest_column > start_column) - (dest_column < start_column)
+    desired_direction = (row_sign + 1) * 3 + column_sign + 1
+
+    has_opponent, has_own, allowed_directions, center_has_own = _scan_piece(piece, current_code, waiting_code)
+
+    # Check that the piece spaces do not contain the opponent's stones.
+    if has_opponent:
+        return _OPPONENT_STONES
+
+    # Checks if player has no stones within the piece and therefor is unable to move it.
+    if not has_own:
+        return _NO_STONES
+
+    # Determines max spaces the piece is allowed to move (17 if center space is occupied, otherwise 3) and compares
+    # the distances between the start and destination to it.
+    allowed_movement = 17 if center_has_own else 3
+    if abs(dest_row - start_row) > allowed_movement or abs(dest_column - start_column) > allowed_movement:
+        return _TOO_MANY_SPACES
+
+    # Checks if desired direction is allowed.
+    if not (allowed_directions >> desired_direction) & 1:
+        return _DIRECTION_MISMATCH
+
+    # Uses direction to check the path of the piece.
+    return _obstruction_check(board, start_row, start_column, dest_row, dest_column, desired_direction)
+
 
 class Footprint:
     """Represents a footprint object, which is a 3x3 square section of the board that makes up a piece. Contains data
@@ -22,44 +291,21 @@ class Footprint:
     make up the footprint.
     """
 
+    __slots__ = ('_center_coordinates', '_center_grid_coordinates', '_footprint_coordinates')
+
     def to_grid_coordinate(self):
         """Takes in user inputted string coordinates and returns coordinates in (row, column) format, in
         order to make them usable for the logic of the other class methods and make_move function of GessGame.
         """
 
-        # Assigns numerical values to the letter values which represents columns.
-        column_dict = {"a": 0, "b": 1, "c": 2, "d": 3, "e": 4, "f": 5, "g": 6, "h": 7, "i": 8, "j": 9, "k": 10,
-                       "l": 11, "m": 12, "n": 13, "o": 14, "p": 15, "q": 16, "r": 17, "s": 18, "t": 19}
-
-        # Grabs first letter of coordinate and gets the column number from the above dictionary.
-        column = column_dict[self._center_coordinates[0]]
-        # Row coordinate looks at the rest of the characters of the entered location to locate the row.
-        row = 20 - int(self._center_coordinates[1:])
-
-        coordinates = [row, column]
-
-        return coordinates
+        return list(_to_grid_coordinate(self._center_coordinates))
 
     def to_full_footprint(self):
-        """Returns a list of the coordinates of the 9 squares that compose the footprint."""
-
-        foot_print_coordinates = []
-        center = self._center_grid_coordinates
-        northwest = [center[0] - 1, center[1] - 1]
-        west = [center[0], center[1] - 1]
-        southwest = [center[0] + 1, center[1] - 1]
-        south = [center[0] + 1, center[1]]
-        north = [center[0] - 1, center[1]]
-        northeast = [center[0] - 1, center[1] + 1]
-        east = [center[0], center[1] + 1]
-        southeast = [center[0] + 1, center[1] + 1]
-
-        directions = [center, northwest, west, southwest, south, north, northeast, east, southeast]
-
-        for direction in directions:
-            foot_print_coordinates.append(direction)
+        """Returns an array of the coordinates of the 9 squares that compose the footprint, one (row, column) pair per
+        row, in the order center, NW, W, SW, S, N, NE, E, SE.
+        """
 
-        return foot_print_coordinates
+        return np.asarray(self._center_grid_coordinates, dtype=np.int8) + _OFFSETS
 
     def __init__(self, center_coordinates):
         """Initialized using user-entered coordinates, defines the entire footprint and area surrounding the center
@@ -68,17 +314,21 @@ class Footprint:
         """
         self._center_coordinates = center_coordinates
         self._center_grid_coordinates = self.to_grid_coordinate()
-        self._footprint_coordinates = self.to_full_footprint()
+        # The 9 squares aren't needed to validate or execute a move, so they're only computed when first asked for.
+        self._footprint_coordinates = None
 
     def get_center_coordinates(self):
         return self._center_grid_coordinates
 
     def get_footprint_coordinates(self):
+        if self._footprint_coordinates is None:
+            self._footprint_coordinates = self.to_full_footprint()
         return self._footprint_coordinates
 
     def set_center_coordinates(self, center_coordinates):
         """Takes in coordinates in [4,5] format to create Footprints using non-user input. Not to be used by players."""
         self._center_grid_coordinates = center_coordinates
+        self._footprint_coordinates = None
 
     def __repr__(self):
         """Represent footprints using player friendly coordinate notation. ex. ('b6')"""
@@ -93,9 +343,10 @@ class GessGame:
      called to forfeit the game, and make_move handles the logic of the turn by turn playing of Gess.
      """
 
-    def __init__(self):
+    def __init__(self, verbose=True):
         """Initializes a GessGame starting board with empty spaces represented with "E", white pieces with "W", black
         pieces with "B", the current player's to the black player, and sets the current game state to UNFINISHED.
+        When verbose is False, make_move doesn't print why a move is invalid, e.g. for games played by a program.
         """
         # Cosmetics
         self._empty_placeholder = "E"
@@ -103,46 +354,40 @@ class GessGame:
         self._info_text_color = 'blue'
         self._warning_text_color = 'red'
         self._instruction_text_color = 'green'
+        self._verbose = verbose
+        # Colored column labels and row numbers, top row first, formatted once rather than on every print of the board.
+        self._column_labels = colored(list(_COL_LETTERS), self._labels_color)
+        self._row_labels = [colored(f"{n:02d}", self._labels_color) for n in range(20, 0, -1)]
+        # Colored messages for each reason a move can be rejected, formatted once rather than on every invalid move.
+        self._error_strings = {reason: colored(message, self._warning_text_color)
+                               for reason, message in _ERROR_MESSAGES.items()}
+        # Method handling each key a player can enter in play_game. A handler returns True when the game should end.
+        self._key_handlers = {'v': self.get_playable_board, 'm': self._prompt_move, 'q': self._prompt_resign}
 
         # Game logic
-        self._game_state = "UNFINISHED"
+        self._game_state = _UNFINISHED
         self._current_player = "BLACK"
         self._waiting_player = "WHITE"
-        self._board = [
-           #  a    b    c    d    e    f    g    h    i    j    k    l    m    n    o    p    q    r    s    t
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 20
-            ["E", "E", "W", "E", "W", "E", "W", "W", "W", "W", "W", "W", "W", "W", "E", "W", "E", "W", "E", "E"],  # 19
-            ["E", "W", "W", "W", "E", "W", "E", "W", "W", "W", "W", "E", "W", "E", "W", "E", "W", "W", "W", "E"],  # 18
-            ["E", "E", "W", "E", "W", "E", "W", "W", "W", "W", "W", "W", "W", "W", "E", "W", "E", "W", "E", "E"],  # 17
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 16
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 15
-            ["E", "E", "W", "E", "E", "W", "E", "E", "W", "E", "E", "W", "E", "E", "W", "E", "E", "W", "E", "E"],  # 14
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 13
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 12
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 11
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 10
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 9
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 8
-            ["E", "E", "B", "E", "E", "B", "E", "E", "B", "E", "E", "B", "E", "E", "B", "E", "E", "B", "E", "E"],  # 7
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 6
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 5
-            ["E", "E", "B", "E", "B", "E", "B", "B", "B", "B", "B", "B", "B", "B", "E", "B", "E", "B", "E", "E"],  # 4
-            ["E", "B", "B", "B", "E", "B", "E", "B", "B", "B", "B", "E", "B", "E", "B", "E", "B", "B", "B", "E"],  # 3
-            ["E", "E", "B", "E", "B", "E", "B", "B", "B", "B", "B", "B", "B", "B", "E", "B", "E", "B", "E", "E"],  # 2
-            ["E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E", "E"],  # 1
-        ]
+        self._current_code = _BLACK
+        self._waiting_code = _WHITE
+        # Each game gets its own copy of the starting board.
+        self._board = _START_BOARD.copy()
+        # Characters used to print each square code, indexed by code.
+        self._symbols = np.array([self._empty_placeholder, "B", "W"])
 
     def get_game_state(self):
-        return self._game_state
+        return _STATE_NAMES[self._game_state]
 
     def set_game_state(self, state):
-        self._game_state = state
+        self._game_state = _STATE_CODES[state]
 
     def set_current_player(self, player):
         self._current_player = player
+        self._current_code = _PLAYER_CODES[player]
 
     def set_waiting_player(self, player):
         self._waiting_player = player
+        self._waiting_code = _PLAYER_CODES[player]
 
     def get_current_player(self):
         return self._current_player
@@ -156,41 +401,33 @@ class GessGame:
         """
 
         if self._current_player == "BLACK":
-            self._game_state = "WHITE_WON"
+            self._game_state = _WHITE_WON
         else:
-            self._game_state = "BLACK_WON"
+            self._game_state = _BLACK_WON
         self.game_over()
 
     def game_over(self):
         """Prints farewell message once game has ended, according to game state."""
-        if self._game_state == "WHITE_WON":
+        if self._game_state == _WHITE_WON:
             return print("Congratulations white player! You won!")
-        elif self._game_state == "BLACK_WON":
+        elif self._game_state == _BLACK_WON:
             return print("Congratulations black player! You won!")
-        elif self._game_state == "UNFINISHED":
+        elif self._game_state == _UNFINISHED:
             raise ValueError
 
     def get_current_board(self):
         """Prints current Gess board."""
-        for row in self._board:
-            print(row)
+        rows = self._symbols[self._board].tolist()
+        sys.stdout.write('\n'.join(str(row) for row in rows) + '\n')
 
     def get_playable_board(self):
-        """Prints board in user friendly format, including coordinate labels and colors.
+        """Prints board in user friendly format, including coordinate labels and colors. The whole board is written
+        with a single write rather than one print per row.
         """
-        lower_case_letters = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j',
-                              'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't']
-
-        # Color column labels.
-        print('   ' + colored(lower_case_letters, self._labels_color))
-
-        # Color row numbers.
-        for n, row in enumerate(self._board):
-            n = 20 - n
-            if n < 10:
-                print(colored('0' + str(n), self._labels_color), row)
-            else:
-                print(colored(n, self._labels_color), row)
+        rows = self._symbols[self._board].tolist()
+        lines = ['   ' + self._column_labels]
+        lines.extend(f"{self._row_labels[n]} {row}" for n, row in enumerate(rows))
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def alter_board_display(self, placeholder):
         """Takes in a character/string to represent the empty spaces and alters the Gess board so the inputted
@@ -199,395 +436,84 @@ class GessGame:
         """
 
         # Handles if the user attempts to set empty spots to the black or white piece characters.
-        if placeholder == "W" or "B":
+        if placeholder in ("W", "B"):
             placeholder = " "
 
-        for row in self._board:
-            for n, i in enumerate(row):
-                if i == "E":
-                    row[n] = placeholder
-
-        # Resets empty placeholder attribute to user entered placeholder value.
+        # Resets empty placeholder attribute to user entered placeholder value. The board itself only stores codes,
+        # so only the characters used to print it need to change.
         self._empty_placeholder = placeholder
+        self._symbols = np.array([placeholder, "B", "W"])
 
     def make_move(self, start_footprint, destination_footprint):
         """Takes in the coordinates of the center space of a piece and the desired location for that center space to
         be moved to, in format ('b3', 'c6') if the player wanted to move a piece with a center stone currently located
-        at column b, row 3, to column c, row 6. Will create Footprint objects for the start and destination locations.
-        Will return true if input is valid, piece is valid, and move is valid. Returns False otherwise.
+        at column b, row 3, to column c, row 6. Only the centers of the start and destination footprints are needed, so
+        they are looked up directly rather than creating Footprint objects. Will return true if input is valid, piece
+        is valid, and move is valid. Returns False otherwise.
         """
 
-        # Creates Footprint objects based on user enter coordinates. Raises error and stops move for bad input.
+        # Center coordinates of both footprints, based on user entered coordinates. Stops move for bad input.
         try:
-            start_footprint = Footprint(start_footprint)
-            destination_footprint = Footprint(destination_footprint)
+            start_row, start_column = _to_grid_coordinate(start_footprint)
+            dest_row, dest_column = _to_grid_coordinate(destination_footprint)
         except KeyError:
-            print(colored("Bad input! Enter valid coordinates for pieces!", self._warning_text_color))
-            return False
-
-        def is_valid_piece():
-            """Checks if the current middle location is a valid piece, meaning the 8 squares surrounding it are
-            either empty or contain stones owned by the player who is attempting to make the move. If the piece is
-            valid, True is returned, otherwise returns False.
-            """
-
-            piece_coordinates = start_footprint.to_full_footprint()
-            current_player_stones = 0
-
-            for adjacent_space in piece_coordinates:
-                adjacent_space_x = adjacent_space[0]
-                adjacent_space_y = adjacent_space[1]
-
-                # Checks how many stones the player has within the 9 space piece.
-                if self._board[adjacent_space_x][adjacent_space_y] == self._current_player[0]:
-                    current_player_stones += 1
-
-                # Check that the piece spaces do not contain the opponent's stones.
-                if self._board[adjacent_space_x][adjacent_space_y] == self._waiting_player[0]:
-                    print(colored("Contains opponents stones, you can't move this footprint!",
-                                  self._warning_text_color))
-                    return False
-
-            # Checks if player has no stones within the piece and therefor is unable to move it.
-            if current_player_stones == 0:
-                print(colored("None of your stones are present in this footprint. You can't move this footprint!",
-                              self._warning_text_color))
-                return False
-            return True
+            return self._reject_move(_BAD_INPUT)
+
+        # Checks if the piece is valid to be moved by the current player, and that the desired move is valid.
+        reason = _validate(self._board.tobytes(), start_row, start_column, dest_row, dest_column, self._current_code,
+                           self._waiting_code)
+        if reason != _VALID:
+            return self._reject_move(reason)
+
+        # Executes the move once the piece and move are deemed valid.
+        self._execute_move(start_row, start_column, dest_row, dest_column)
+        # After move is executed, checks for player winning and thus ending the game, updates game status if so.
+        self._check_for_win()
+        # Checks game status, changes current player and waiting player.
+        self._update_game()
+        return True
+
+    def _execute_move(self, start_row, start_column, dest_row, dest_column):
+        """Takes in the center coordinates of the start and destination footprints of a validated move and executes
+        it, altering the pieces on the Gess board accordingly. Returns nothing.
+        """
 
-        def is_valid_move():
-            """Checks for move validity. (User has entered start and destination points that make a valid move.)
-            Returns True if move is valid, False if not.
-            """
+        # Copy the 'contents' of the start footprint, so that they are kept when the start and destination
+        # footprints overlap, then set the start footprint to empty and place them in the destination footprint.
+        start_contents = self._board[start_row - 1:start_row + 2, start_column - 1:start_column + 2].copy()
+        self._board[start_row - 1:start_row + 2, start_column - 1:start_column + 2] = _EMPTY
+        self._board[dest_row - 1:dest_row + 2, dest_column - 1:dest_column + 2] = start_contents
 
-            def spaces_allowed():
-                """Checks Footprint for player stone in center space, dictating how many spaces are allowed to move.
-                Determines if the player's desired movement is greater than allowed movement.
-                """
+    def _check_for_win(self):
+        """Checks the Gess board for player winning. (Player's last ring being destroyed.) Updates the game status
+        accordingly, potentially ending the game. Returns nothing.
+        """
 
-                # Determines max spaces the piece is allowed to move. (17 if center space is occupied, otherwise 3.)
-                if self._board[start_footprint.get_center_coordinates()[0]]\
-                    [start_footprint.get_center_coordinates()[1]] == self._current_player[0]:
-                    allowed_movement = 17
-                else:
-                    allowed_movement = 3
-
-                # Compares the start and destination location coordinates to determine if their distance is greater
-                # than the allowed movement by that footprint.
-                if abs(start_footprint.get_center_coordinates()[0] - destination_footprint.get_center_coordinates()[0])\
-                    > allowed_movement or abs(start_footprint.get_center_coordinates()[1] -\
-                                              destination_footprint.get_center_coordinates()[1]) > allowed_movement:
-                    print(colored("You are trying to move too many spaces!", self._warning_text_color))
-                    return False
-                else:
-                    return True
-
-            def direction_allowed():
-                """Checks stones within Footprint to determine which directions the Footprint is allowed to move and
-                determines if the user desired direction is allowed. Also checks if the destination is in the path of
-                the desired direction. Returns False if the desired direction is invalid. If the desired direction is
-                valid, the desired direction is returned.
-                """
-
-                start_center = start_footprint.get_center_coordinates()
-                dest_center = destination_footprint.get_center_coordinates()
-
-                # Determines desired desired_direction by comparing start and destination center coordinates.
-                if start_center[0] == dest_center[0] and start_center[1] > dest_center[1]:
-                    desired_direction = "west"
-                elif start_center[0] == dest_center[0] and start_center[1] < dest_center[1]:
-                    desired_direction = "east"
-                elif start_center[0] < dest_center[0] and start_center[1] == dest_center[1]:
-                    desired_direction = "south"
-                elif start_center[0] > dest_center[0] and start_center[1] == dest_center[1]:
-                    desired_direction = "north"
-                elif start_center[0] > dest_center[0] and start_center[1] > dest_center[1]:
-                    desired_direction = "northwest"
-                elif start_center[0] < dest_center[0] and start_center[1] > dest_center[1]:
-                    desired_direction = "southwest"
-                elif start_center[0] > dest_center[0] and start_center[1] < dest_center[1]:
-                    desired_direction = "northeast"
-                elif start_center[0] < dest_center[0] and start_center[1] < dest_center[1]:
-                    desired_direction = "southeast"
-                else:
-                    desired_direction = "invalid"
-
-                # Determines the directions a piece is allowed to move, according to which squares are occupied.
-                allowed_directions = []
-
-                for index, space in enumerate(start_footprint.get_footprint_coordinates()):
-                    if self._board[space[0]][space[1]] == self._current_player[0]:
-                        if index == 1:
-                            allowed_directions.append("northwest")
-                        elif index == 2:
-                            allowed_directions.append("west")
-                        elif index == 3:
-                            allowed_directions.append("southwest")
-                        elif index == 4:
-                            allowed_directions.append("south")
-                        elif index == 5:
-                            allowed_directions.append("north")
-                        elif index == 6:
-                            allowed_directions.append("northeast")
-                        elif index == 7:
-                            allowed_directions.append("east")
-                        elif index == 8:
-                            allowed_directions.append("southeast")
-
-                # Checks if desired direction is allowed.
-                if desired_direction not in allowed_directions:
-                    print(colored("Mismatch of directions! Can't move that way!", self._warning_text_color))
-                    return False
-                else:
-                    return desired_direction
-
-            def obstruction_check(direction):
-                """Checks desired path from start-finish of Footprint to see if it is impeded by any stones. Will
-                return False if path is obstructed and True if the path is valid."""
-
-                # Uses start and destination coordinates to determine if the path is obstructed.
-                start_center = start_footprint.get_center_coordinates()
-                dest_center = destination_footprint.get_center_coordinates()
-
-                def from_grid_coordinate(index_format):
-                    """Takes in python coordinates (grid/index format) and returns coordinates in 'i3' format, in
-                    order to create new instances of the Footprint class.
-                    """
-
-                    # Assigns letter values to the numerical values that represent columns.
-                    column_dict = {0: "a", 1: "b", 2: "c", 3: "d", 4: "e", 5: "f", 6: "g", 7: "h", 8: "i", 9: "j",
-                                   10: "k", 11: "l", 12: "m", 13: "n", 14: "o", 15: "p", 16: "q", 17: "r", 18: "s",
-                                   19: "t"}
-
-                    column = column_dict[index_format[1]]
-                    row = 20 - index_format[0]
-                    coordinates_readable = str(column) + str(row)
-
-                    return coordinates_readable
-
-                def create_new_center(alter_row, alter_column, input_foot):
-                    """Takes in values to alter row/column of center based on desired direction in the directional check
-                    function. Produces coordinates for the next footprint center in tracking the movement of a footprint.
-                    Returns those coordinates.
-                    """
-
-                    row = input_foot.get_center_coordinates()[0] + alter_row
-                    column = input_foot.get_center_coordinates()[1] + alter_column
-
-                    return [row, column]
-
-                def directional_check(temp_footprint_input, indices_of_interest, alt_row, alt_column):
-                    """Takes in a temporary footprint which represents the first step in the direction the piece
-                    is attempting to move, the indices which move to new spaces when a piece moves in the desired
-                    direction, and the logic to create a new center in the desired direction in order to move along
-                    the board in the desired direction, checking for obstructions. Returns True if no obstructions and
-                    False if the path is obstructed or there are invalid directions.
-                    """
-
-                    # Create a list of locations to check relevant to movement for specific direction. (The spaces to
-                    # check for obstructions in path of the specific direction.)
-                    all_location_list = temp_footprint_input.get_footprint_coordinates()
-                    key_locations = []
-                    for i in indices_of_interest:
-                        key_locations.append(all_location_list[i])
-                    while True:
-                        try:
-                            # If arrived at the destination unobstructed, obstruction check passed, returns True.
-                            if temp_footprint_input.get_center_coordinates() == dest_center:
-                                return True
-                            else:
-                                # Check squares of temporary footprint that are new with regards to the last footprint.
-                                for space in key_locations:
-                                    # If space is occupied, movement is obstructed, bad move, returns False.
-                                    if self._board[space[0]][space[1]] != self._empty_placeholder:
-                                        print(colored("Obstructed path!", self._warning_text_color))
-                                        return False
-                                # Update temporary center one space in desired direction, create new Footprint, loop.
-                                new_center_temp = create_new_center(alt_row, alt_column, temp_footprint_input)
-                                new_center_temp = from_grid_coordinate(new_center_temp)
-                                temp_footprint_input = Footprint(new_center_temp)
-                        # IndexError will catch if the player has entered movement that 'uses multiple directions' such
-                        # as a move from n6 to o8, wherein the player is trying to move northeast then north.
-                        except IndexError:
-                            print(colored("Invalid movement!", self._warning_text_color))
-                            return False
-
-                if direction == "southeast":
-                    # Defines temporary center and creates Footprint utilizing it, one space to the southeast.
-                    temp_center = from_grid_coordinate([start_center[0] + 1, start_center[1] + 1])
-                    temp_footprint = Footprint(temp_center)
-                    southeast_indices = [3, 4, 6, 7, 8]  # SW(3), S(4), NE(6), E(7) SE(8).
-
-                    return directional_check(temp_footprint, southeast_indices, 1, 1)
-
-                elif direction == "southwest":
-                    # Defines temporary center and creates Footprint utilizing it, one space to the southwest.
-                    temp_center = from_grid_coordinate([start_center[0] + 1, start_center[1] - 1])
-                    temp_footprint = Footprint(temp_center)
-                    southwest_indices = [1, 2, 3, 4, 8]  # NW(1), W(2), SW(3), S(4), SE(8).
-
-                    return directional_check(temp_footprint, southwest_indices, 1, -1)
-
-                elif direction == "northwest":
-                    # Defines temporary center and creates Footprint utilizing it, one space to the northwest.
-                    temp_center = from_grid_coordinate([start_center[0] - 1, start_center[1] - 1])
-                    temp_footprint = Footprint(temp_center)
-                    northwest_indices = [1, 2, 3, 5, 6]  # NW(1), W(2), SW(3), 5(N), NE(6).
-
-                    return directional_check(temp_footprint, northwest_indices, -1, -1)
-
-                elif direction == "north":
-                    # Defines temporary center and creates Footprint utilizing it, one space to the north.
-                    temp_center = from_grid_coordinate([start_center[0] - 1, start_center[1]])
-                    temp_footprint = Footprint(temp_center)
-                    north_indices = [1, 5, 6]  # NW(1), N(5), NE(6).
-
-                    return directional_check(temp_footprint, north_indices, -1, 0)
-
-                elif direction == "northeast":
-                    # Defines temporary center and creates Footprint utilizing it, one space to the northeast.
-                    temp_center = from_grid_coordinate([start_center[0] - 1, start_center[1] + 1])
-                    temp_footprint = Footprint(temp_center)
-                    northeast_indices = [1, 5, 6, 7, 8]  # NW(1), N(5), NE(6), E(7), SE(8).
-
-                    return directional_check(temp_footprint, northeast_indices, -1, 1)
-
-                elif direction == "west":
-                    # Defines temporary center and creates Footprint utilizing it, one space to the west.
-                    temp_center = from_grid_coordinate([start_center[0], start_center[1] - 1])
-                    temp_footprint = Footprint(temp_center)
-                    west_indices = [1, 2, 3]  # NW(1), W(2), SW(3).
-
-                    return directional_check(temp_footprint, west_indices, 0, -1)
-
-                elif direction == "south":
-                    # Defines temporary center and creates Footprint utilizing it, one space to the south.
-                    temp_center = from_grid_coordinate([start_center[0] + 1, start_center[1]])
-                    temp_footprint = Footprint(temp_center)
-                    south_indices = [3, 4, 8]  # SW(3), S(4), SE(8)
-
-                    return directional_check(temp_footprint, south_indices, 1, 0)
-
-                elif direction == "east":
-                    # Defines temporary center and creates Footprint utilizing it, one space to the east.
-                    temp_center = from_grid_coordinate([start_center[0], start_center[1] + 1])
-                    temp_footprint = Footprint(temp_center)
-                    east_indices = [6, 7, 8]  # NE(6), E(7), SE(8)
-
-                    return directional_check(temp_footprint, east_indices, 0, 1)
-
-            # Checks if spaces allowed is False, is_valid_move return False if so.
-            if not spaces_allowed():
-                return False
-            # Checks if direction allowed is False, is_valid_move return False if so.
-            elif not direction_allowed():
-                return False
-            else:
-                # Uses direction to determine potential path of piece.
-                check = obstruction_check(direction_allowed())
-                # If path is obstructed, check equals False, and is_valid_move returns False.
-                if not check:
-                    return False
-                # All checks successful, is_valid_move returns True.
-                else:
-                    return True
-
-        def execute_move():
-            """Validated move is executed, altering the pieces on the Gess board accordingly. Returns nothing."""
-
-            # Fill list with 'contents' of the spots in the start space/footprint.
-            start_contents = []
-            for i in start_footprint.get_footprint_coordinates():
-                x = self._board[i[0]][i[1]]
-                start_contents.append(x)
-
-            # Set all spots in starting spot to "empty".
-            for i in start_footprint.get_footprint_coordinates():
-                self._board[i[0]][i[1]] = self._empty_placeholder
-
-            # Place the original 'contents' of start footprint in the same order into the destination space/footprint.
-            for n, i in enumerate(destination_footprint.get_footprint_coordinates()):
-                self._board[i[0]][i[1]] = start_contents[n]
-
-        def check_for_win():
-            """Checks the Gess board for player winning. (Player's last ring being destroyed.) Updates the game status
-            accordingly, potentially ending the game. Returns nothing.
-            """
-
-            def from_grid_coordinate(index_format):
-                """Takes in python coordinates and returns coordinates in 'i3' format, in order to create new instances
-                of the Footprint class.
-                """
-
-                # Assigns letter values to the numerical values that represent columns.
-                column_dict = {0: "a", 1: "b", 2: "c", 3: "d", 4: "e", 5: "f", 6: "g", 7: "h", 8: "i", 9: "j",
-                               10: "k", 11: "l", 12: "m", 13: "n", 14: "o", 15: "p", 16: "q", 17: "r", 18: "s",
-                               19: "t"}
-
-                c = column_dict[index_format[1]]
-                r = 20 - index_format[0]
-                coordinates_readable = str(c) + str(r)
-
-                return coordinates_readable
-
-            opponent_has_ring = "no"
-
-            # Find all spaces that are empty on the board.
-            for row_number, row in enumerate(self._board):
-                for column_number, space in enumerate(row):
-                    # Get coordinates of empty space, then convert to format needed to make a Footprint. (ex: 'b6')
-                    if space == self._empty_placeholder:
-                        # Create a Footprint using coordinates of empty space.
-                        potential_ring = from_grid_coordinate([row_number, column_number])
-                        potential_ring_footprint = Footprint(potential_ring)
-
-                        # Check for a footprint where there are 8 stones owned by the opposing player. (A ring.)
-                        stones_in_ring = 0
-                        try:
-                            for i in potential_ring_footprint.get_footprint_coordinates():
-                                if self._board[i[0]][i[1]] == self._waiting_player[0]:
-                                    stones_in_ring += 1
-                        # Will skip index errors when attempting to iterate over spaces not on the board.
-                        except IndexError:
-                            continue
-
-                        # If opponent has a ring, game is not over.
-                        if stones_in_ring == 8:
-                            opponent_has_ring = "yes"
-
-            if opponent_has_ring == "yes":
-                return
-            else:
-                self.set_game_state(f"{self._current_player}_WON")
+        # Check for a footprint where there are 8 stones owned by the opposing player. (A ring.) If opponent has a
+        # ring, game is not over. Otherwise the current player has won, which has the same code as their stones.
+        if not _find_ring(self._board, self._waiting_code):
+            self._game_state = self._current_code
 
-        def update_game():
-            """Checks game state for player winning, in which case game is ended game_over is called,  otherwise,
-            changes current player and waiting player in preparation for next turn. Returns nothing.
-            """
+    def _update_game(self):
+        """Checks game state for player winning, in which case game is ended game_over is called,  otherwise,
+        changes current player and waiting player in preparation for next turn. Returns nothing.
+        """
 
-            if self._game_state != "UNFINISHED":
-                self.game_over()
-            else:
-                current = self._current_player
-                waiting = self._waiting_player
-                self.set_waiting_player(current)
-                self.set_current_player(waiting)
-
-        # Checks if the piece is valid to be moved by the current player.
-        if is_valid_piece():
-            # Checks that the desired move is valid.
-            if is_valid_move():
-                # Executes the move once the piece and move are deemed valid.
-                execute_move()
-                # After move is executed, checks for player winning and thus ending the game, updates game status if so.
-                check_for_win()
-                # Checks game status, changes current player and waiting player.
-                update_game()
-                return True
-            else:
-                return False
+        if self._game_state != _UNFINISHED:
+            self.game_over()
         else:
-            return False
+            # Swap the players and the codes of their stones directly, rather than through the setters.
+            self._current_player, self._waiting_player = self._waiting_player, self._current_player
+            self._current_code, self._waiting_code = self._waiting_code, self._current_code
+
+    def _reject_move(self, reason):
+        """Takes in the reason a move is invalid and prints the message for it, unless the game was created with
+        verbose set to False. Returns False, for make_move to return.
+        """
+
+        if self._verbose:
+            print(self._error_strings[reason])
+        return False
 
     def play_game(self):
         """Handles the playing of the Gess game, provides way for players to play the game from the terminal by
@@ -609,26 +535,40 @@ class GessGame:
                                        "m - Make Move.\n"
                                        "q - Quit/Resign.\n",
                                        self._instruction_text_color))
-            if user_input == 'v':
-                self.get_playable_board()
-            elif user_input == 'm':
-                start_coordinates = input(colored("Please enter the start coordinates in 'c3' format...",
-                                                  self._instruction_text_color))
-                end_coordinates = input(colored("Please enter the destination coordinates in 'b6' format...",
-                                                self._instruction_text_color))
-                self.make_move(start_coordinates, end_coordinates)
-                self.get_playable_board()
-            elif user_input == 'q':
-                check = input(colored("Are you sure you would like to forfeit the game? Enter 'y' if so.",
-                                      self._warning_text_color))
-                if check == 'y':
-                    self.resign_game()
+            handler = self._key_handlers.get(user_input)
+            if handler is not None:
+                if handler():
                     break
-            elif self._game_state != "UNFINISHED":
+            elif self._game_state != _UNFINISHED:
                 break
             else:
                 print(colored("Invalid input! Please enter a key for a valid action!", self._warning_text_color))
 
+    def _prompt_move(self):
+        """Asks the player for the start and destination coordinates of their move, makes the move and prints the
+        board. Returns nothing.
+        """
+
+        start_coordinates = input(colored("Please enter the start coordinates in 'c3' format...",
+                                          self._instruction_text_color))
+        end_coordinates = input(colored("Please enter the destination coordinates in 'b6' format...",
+                                        self._instruction_text_color))
+        self.make_move(start_coordinates, end_coordinates)
+        self.get_playable_board()
+
+    def _prompt_resign(self):
+        """Asks the player to confirm that they want to forfeit the game, and resigns it if so. Returns True if the
+        game was resigned, False otherwise.
+        """
+
+        check = input(colored("Are you sure you would like to forfeit the game? Enter 'y' if so.",
+                              self._warning_text_color))
+        if check == 'y':
+            self.resign_game()
+            return True
+        return False
+
 
-game = GessGame()
-game.play_game()
+if __name__ == '__main__':
+    game = GessGame()
+    game.play_game()
@@ -1,3 +1,5 @@
+import contextlib
+import io
 import unittest
 from GessGame import Footprint, GessGame
 
@@ -20,7 +22,8 @@ class TestFootprintBasics(unittest.TestCase):
         """Tests accurate locations of the 9 squares of the footprint."""
         test_foot = Footprint('f17')
         footprint_coordinates = test_foot.get_footprint_coordinates()
-        self.assertEqual(footprint_coordinates,[[3, 5], [2, 4], [3, 4], [4, 4], [4, 5], [2, 5], [2, 6], [3, 6], [4, 6]])
+        self.assertEqual(footprint_coordinates.tolist(),
+                         [[3, 5], [2, 4], [3, 4], [4, 4], [4, 5], [2, 5], [2, 6], [3, 6], [4, 6]])
 
 
 class TestGameBasics(unittest.TestCase):
@@ -38,6 +41,36 @@ class TestGameBasics(unittest.TestCase):
         test_game.resign_game()
         self.assertEqual(test_game.get_game_state(), "WHITE_WON")
 
+    def test_set_game_state(self):
+        """Tests that a game state set by name is returned by name."""
+        test_game = GessGame()
+        test_game.set_game_state("BLACK_WON")
+        self.assertEqual(test_game.get_game_state(), "BLACK_WON")
+
+    def test_quiet_invalid_move(self):
+        """Tests that a game created with verbose set to False doesn't print why a move is invalid."""
+        game = GessGame(verbose=False)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result = game.make_move('c3', 'b4')
+        self.assertFalse(result)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_alter_board_display(self):
+        """Tests that the empty placeholder is used when the board is printed, unless it is a stone character."""
+        game = GessGame()
+        game.alter_board_display('.')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            game.get_current_board()
+        self.assertEqual(output.getvalue().splitlines()[0], str(['.'] * 20))
+
+        game.alter_board_display('B')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            game.get_current_board()
+        self.assertEqual(output.getvalue().splitlines()[0], str([' '] * 20))
+
     def test_invalid_user_input(self):
         """Tests error handling for user entering coordinates not on the board."""
         game = GessGame()
@@ -180,6 +213,24 @@ class TestPieceMovement(unittest.TestCase):
         result = game.make_move('h3', 'k3')
         self.assertFalse(result)
 
+    def test_multiple_directions_invalid(self):
+        """Tests that a destination not in a straight line from the start is rejected."""
+        game = GessGame()
+        result = game.make_move('i3', 'j5')
+        self.assertFalse(result)
+
+    def test_destination_on_edge(self):
+        """Tests that a footprint can't be moved so that its center is on the edge of the board."""
+        game = GessGame()
+        result = game.make_move('s3', 't3')
+        self.assertFalse(result)
+
+    def test_obstructed_beyond_first_step(self):
+        """Tests that every step of the path is checked for obstructions, not only the first."""
+        game = GessGame()
+        result = game.make_move('i3', 'i12')
+        self.assertFalse(result)
+
 
 class TestMultipleMoves(unittest.TestCase):
     """Tests multiple moves for correct functionality/game state."""
@@ -203,6 +254,16 @@ class TestMultipleMoves(unittest.TestCase):
         game.make_move('c3', 'c6')
         self.assertEqual(game.get_waiting_player(), "BLACK")
 
+    def test_black_won(self):
+        """Tests that black wins once white has broken its only ring and black makes a move."""
+        game = GessGame()
+        game.alter_board_display(" ")
+        game.make_move('i3', 'i6')
+        game.make_move('k17', 'j17')
+        self.assertEqual(game.get_game_state(), "UNFINISHED")
+        game.make_move('r3', 'r6')
+        self.assertEqual(game.get_game_state(), "BLACK_WON")
+
 
 if __name__ == '__main__':
-    unittest.main(exit=False)
\ No newline at end of file
+    unittest.main(exit=False)
\ No newline at end of file